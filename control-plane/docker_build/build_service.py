@@ -254,7 +254,7 @@ EXPOSE 8080
 
 # Health check
 HEALTHCHECK --interval=30s --timeout=10s --start-period=40s --retries=3 \\
-    CMD python -c "import requests; requests.get('http://localhost:8080/health')" || exit 1
+    CMD python -I -S -c "from urllib.request import urlopen; urlopen('http://localhost:8080/health', timeout=5).read()" || exit 1
 
 # Run agent (wrapper forces __main__ so uvicorn server starts)
 CMD ["python", "scripts/run_agent_server.py", "{agent_id}"]
@@ -322,14 +322,10 @@ def build_docker_image(
     
     image_name = f"agent-{agent_id.lower()}:{tag}"
     
-    # Build command
+    # Build command (with optional build args)
     cmd = ["docker", "build", "-t", image_name, "-f", str(dockerfile_path), str(context_path)]
-    
-    # Add build args
-    if build_args:
-        for key, value in build_args.items():
-            cmd.extend(["--build-arg", f"{key}={value}"])
-    
+    cmd += [arg for key, value in (build_args or {}).items() for arg in ("--build-arg", f"{key}={value}")]
+
     try:
         result = subprocess.run(
             cmd,
@@ -6,6 +6,7 @@ Provides:
 - disable_model(model_id) / enable_model(model_id) - Control model usage
 - is_agent_disabled(agent_id) / is_model_disabled(model_id) - Check status
 - list_disabled() - List all disabled agents and models
+- snapshot() - Frozen view of disabled agents and models for batch checks
 """
 
 from .state import (
@@ -16,6 +17,7 @@ from .state import (
     is_agent_disabled,
     is_model_disabled,
     list_disabled,
+    snapshot,
 )
 
 __all__ = [
@@ -26,4 +28,5 @@ __all__ = [
     "enable_model",
     "is_model_disabled",
     "list_disabled",
+    "snapshot",
 ]
@@ -82,3 +82,16 @@ def list_disabled() -> dict[str, list[str]]:
         "agents": sorted(_disabled_agents),
         "models": sorted(_disabled_models)
     }
+
+
+def snapshot() -> dict[str, frozenset[str]]:
+    """
+    Snapshot the disabled agents and models for repeated membership checks.
+    
+    Returns:
+        Dict with "agents" and "models" frozensets
+    """
+    return {
+        "agents": frozenset(_disabled_agents),
+        "models": frozenset(_disabled_models)
+    }
@@ -2,76 +2,51 @@
 """
 Run script for control-plane API.
 
-Handles the hyphenated directory name issue by setting up package structure.
+Handles the hyphenated directory name issue by mapping the ``control_plane``
+package onto the ``control-plane/`` directory with a meta path finder.
+
+Serves with uvloop + httptools when available:
+
+    pip install "uvicorn[standard]"
 """
 
+import os
 import sys
-from pathlib import Path
+import importlib.abc
+import importlib.machinery
 import importlib.util
-import types
 
 # Add parent directory to path
-repo_root = Path(__file__).resolve().parent
-sys.path.insert(0, str(repo_root))
+repo_root = os.path.dirname(os.path.realpath(__file__))
+sys.path.insert(0, repo_root)
+
+
+class ControlPlaneFinder(importlib.abc.MetaPathFinder):
+    """Resolve ``control_plane`` to the on-disk ``control-plane/`` directory.
+
+    Only the top-level package needs special handling: its ``__path__`` points
+    at ``control-plane/``, so submodules (``control_plane.api.routes.*``) are
+    found and cached by the standard path finder.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname != "control_plane":
+            return None
+        spec = importlib.machinery.ModuleSpec(fullname, None, is_package=True)
+        spec.submodule_search_locations = [self.root]
+        return spec
 
-# Import uvicorn
-import uvicorn
 
 if __name__ == "__main__":
     # Set up package structure so relative imports work
-    # Create fake package modules for control_plane.api.routes
-    control_plane_pkg = types.ModuleType("control_plane")
-    control_plane_pkg.__package__ = "control_plane"
-    control_plane_api_pkg = types.ModuleType("control_plane.api")
-    control_plane_api_pkg.__package__ = "control_plane.api"
-    control_plane_api_routes_pkg = types.ModuleType("control_plane.api.routes")
-    control_plane_api_routes_pkg.__package__ = "control_plane.api.routes"
-    
-    sys.modules["control_plane"] = control_plane_pkg
-    sys.modules["control_plane.api"] = control_plane_api_pkg
-    sys.modules["control_plane.api.routes"] = control_plane_api_routes_pkg
-    
-    # Load routes modules first (they use relative imports)
-    # Load auth first since admin_tools and admin_policies depend on it
-    routes_dir = repo_root / "control-plane" / "api" / "routes"
-    route_modules = ["agents", "audit", "kill_switch", "policies", "tools", "auth", "admin_tools", "admin_policies", "admin_agents", "deployments", "docker_build", "gke_deploy", "a2a", "mesh", "models", "code_gen"]
-    for route_name in route_modules:
-        route_file = routes_dir / f"{route_name}.py"
-        if route_file.exists():
-            try:
-                spec = importlib.util.spec_from_file_location(f"control_plane.api.routes.{route_name}", route_file)
-                if spec and spec.loader:
-                    route_mod = importlib.util.module_from_spec(spec)
-                    route_mod.__package__ = "control_plane.api.routes"
-                    route_mod.__name__ = f"control_plane.api.routes.{route_name}"
-                    sys.modules[f"control_plane.api.routes.{route_name}"] = route_mod
-                    spec.loader.exec_module(route_mod)
-                    setattr(control_plane_api_routes_pkg, route_name, route_mod)
-                    print(f"✓ Loaded route: {route_name}")
-                else:
-                    print(f"⚠ Warning: Could not create spec for {route_name}")
-            except Exception as e:
-                print(f"✗ Error loading route {route_name}: {e}")
-                import traceback
-                traceback.print_exc()
-        else:
-            print(f"⚠ Warning: Route file not found: {route_file}")
-    
-    # Now load main.py (it can use relative imports)
-    main_py = repo_root / "control-plane" / "api" / "main.py"
-    spec = importlib.util.spec_from_file_location("control_plane.api.main", main_py)
-    if spec and spec.loader:
-        main_mod = importlib.util.module_from_spec(spec)
-        main_mod.__package__ = "control_plane.api"
-        main_mod.__name__ = "control_plane.api.main"
-        sys.modules["control_plane.api.main"] = main_mod
-        spec.loader.exec_module(main_mod)
-        app = main_mod.app
-    else:
-        raise ImportError("Could not load main.py")
+    sys.meta_path.insert(0, ControlPlaneFinder(os.path.join(repo_root, "control-plane")))
+    from control_plane.api.main import app
     
     # Run uvicorn (HTTPS if SSL_KEYFILE and SSL_CERTFILE are set)
-    import os
+    import uvicorn
     port = int(os.getenv("PORT", "8010"))
     ssl_keyfile = os.getenv("SSL_KEYFILE")
     ssl_certfile = os.getenv("SSL_CERTFILE")
@@ -84,8 +59,16 @@ if __name__ == "__main__":
     print("=" * 60)
     print("Examples: PORT=8011 python run_control_plane.py")
     print("          SSL_KEYFILE=key.pem SSL_CERTFILE=cert.pem python run_control_plane.py  # HTTPS")
+    print("          LOG_LEVEL=warning python run_control_plane.py  # production")
     print("=" * 60)
-    kwargs = {"host": "0.0.0.0", "port": port, "log_level": "info"}
+    kwargs = {
+        "host": "0.0.0.0",
+        "port": port,
+        "log_level": os.getenv("LOG_LEVEL", "info"),
+        "loop": "uvloop" if importlib.util.find_spec("uvloop") else "auto",
+        "http": "httptools" if importlib.util.find_spec("httptools") else "auto",
+        "access_log": False,
+    }
     if use_https:
         kwargs["ssl_keyfile"] = ssl_keyfile
         kwargs["ssl_certfile"] = ssl_certfile
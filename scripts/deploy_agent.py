@@ -10,60 +10,260 @@ Usage:
     python scripts/deploy_agent.py --agent payment_failed --target gke --project my-project --cluster my-cluster
 """
 
-import argparse
+import collections
+import copy
+import functools
+import os
+import shutil
+import string
 import subprocess
 import sys
+import tempfile
+import types
 from pathlib import Path
-import yaml
-import json
 
 repo_root = Path(__file__).resolve().parent.parent
 
+# Base image for agent containers. Set AGENT_BASE_IMAGE to a digest-pinned reference
+# (e.g. python:3.11-slim@sha256:...) for reproducible, content-addressed pulls.
+_BASE_IMAGE = os.environ.get("AGENT_BASE_IMAGE", "python:3.11-slim")
 
-def load_agent_definition(agent_id: str) -> dict:
-    """Load agent definition from config."""
-    config_file = repo_root / "config" / "agents" / f"{agent_id}.yaml"
-    if not config_file.exists():
-        raise FileNotFoundError(f"Agent definition not found: {config_file}")
-    
-    with open(config_file, "r") as f:
-        return yaml.safe_load(f)
+_DOCKERFILE_TMPL = string.Template("""# Build stage: compile dependencies (gcc never reaches the runtime image)
+FROM $base_image AS builder
 
+RUN apt-get update && apt-get install -y --no-install-recommends \\
+    gcc \\
+    && rm -rf /var/lib/apt/lists/*
 
-def generate_dockerfile(agent_id: str, control_plane_url: str = "http://localhost:8010") -> str:
-    """Generate Dockerfile for agent."""
-    return f"""FROM python:3.11-slim
+COPY requirements.txt .
+RUN python -m venv /opt/venv \\
+    && /opt/venv/bin/pip install --no-cache-dir -r requirements.txt
 
-WORKDIR /app
+# Runtime stage
+FROM $base_image
 
-# Install system dependencies
-RUN apt-get update && apt-get install -y \\
-    gcc \\
-    && rm -rf /var/lib/apt/lists/*
+WORKDIR /app
 
 # Install Python dependencies
-COPY requirements.txt .
-RUN pip install --no-cache-dir -r requirements.txt
+COPY --from=builder /opt/venv /opt/venv
+ENV PATH=/opt/venv/bin:$$PATH
 
 # Copy agent code
-COPY agents/{agent_id}/ ./agents/{agent_id}/
+COPY agents/$agent_id/ ./agents/$agent_id/
 COPY agent-sdk/ ./agent-sdk/
 COPY config/ ./config/
 
+# Pre-compile bytecode so pods don't pay for it on cold start
+RUN python -m compileall -q -j 0 /app/agents /app/agent-sdk
+
 # Set environment variables
-ENV CONTROL_PLANE_URL={control_plane_url}
+ENV CONTROL_PLANE_URL=$control_plane_url
 ENV PYTHONPATH=/app
+ENV PYTHONDONTWRITEBYTECODE=1 PYTHONUNBUFFERED=1
 
 # Expose port (default 8080)
 EXPOSE 8080
 
 # Health check
 HEALTHCHECK --interval=30s --timeout=10s --start-period=40s --retries=3 \\
-    CMD python -c "import requests; requests.get('http://localhost:8080/health')" || exit 1
+    CMD python -I -S -c "from urllib.request import urlopen; urlopen('http://localhost:8080/health', timeout=5).read()" || exit 1
 
 # Run agent
-CMD ["python", "-m", "agents.{agent_id}.agent"]
-"""
+CMD ["python", "-m", "agents.$agent_id.agent"]
+""")
+
+# Kubernetes manifest skeletons; generate_k8s_manifest deep-copies and patches the per-agent fields.
+_DEPLOYMENT_TEMPLATE = {
+    "apiVersion": "apps/v1",
+    "kind": "Deployment",
+    "metadata": {
+        "name": None,
+        "namespace": None,
+        "labels": {
+            "app": None,
+            "component": "agent"
+        }
+    },
+    "spec": {
+        "replicas": 1,
+        "selector": {
+            "matchLabels": {}
+        },
+        "template": {
+            "metadata": {
+                "labels": {}
+            },
+            "spec": {
+                "containers": [{
+                    "name": None,
+                    "image": None,
+                    "ports": [{
+                        "containerPort": 8080
+                    }],
+                    "env": [
+                        {
+                            "name": "CONTROL_PLANE_URL",
+                            "value": None
+                        },
+                        {
+                            "name": "GOOGLE_API_KEY",
+                            "valueFrom": {
+                                "secretKeyRef": {
+                                    "name": "agent-secrets",
+                                    "key": "google-api-key"
+                                }
+                            }
+                        }
+                    ],
+                    "resources": {
+                        "requests": {
+                            "cpu": "100m",
+                            "memory": "256Mi"
+                        },
+                        "limits": {
+                            "cpu": "500m",
+                            "memory": "512Mi"
+                        }
+                    },
+                    "livenessProbe": {
+                        "httpGet": {
+                            "path": "/health",
+                            "port": 8080
+                        },
+                        "initialDelaySeconds": 30,
+                        "periodSeconds": 10
+                    },
+                    "readinessProbe": {
+                        "httpGet": {
+                            "path": "/health",
+                            "port": 8080
+                        },
+                        "initialDelaySeconds": 10,
+                        "periodSeconds": 5
+                    }
+                }]
+            }
+        }
+    }
+}
+
+_SERVICE_TEMPLATE = {
+    "apiVersion": "v1",
+    "kind": "Service",
+    "metadata": {
+        "name": None,
+        "namespace": None,
+        "labels": {}
+    },
+    "spec": {
+        "type": "ClusterIP",
+        "ports": [{
+            "port": 80,
+            "targetPort": 8080,
+            "protocol": "TCP"
+        }],
+        "selector": {}
+    }
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml():
+    """Import PyYAML on first use; returns (yaml, SafeLoader, SafeDumper), preferring libyaml."""
+    import yaml
+    if yaml.__with_libyaml__:
+        return yaml, yaml.CSafeLoader, yaml.CSafeDumper
+    return yaml, yaml.SafeLoader, yaml.SafeDumper
+
+
+@functools.lru_cache(maxsize=None)
+def load_agent_definition(agent_id: str) -> dict:
+    """Load agent definition from config (cached per agent_id; call cache_clear() to re-read)."""
+    config_file = repo_root / "config" / "agents" / f"{agent_id}.yaml"
+    if not config_file.exists():
+        raise FileNotFoundError(f"Agent definition not found: {config_file}")
+    
+    yaml, safe_loader, _ = _yaml()
+    with open(config_file, "r") as f:
+        return yaml.load(f, Loader=safe_loader)
+
+
+def _run_streaming(cmd: list, tail_lines: int = 200) -> tuple:
+    """Run a command, echoing its output live; returns (returncode, last output lines)."""
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
+    tail = collections.deque(maxlen=tail_lines)
+    for line in proc.stdout:
+        sys.stdout.write(line)
+        tail.append(line)
+    return proc.wait(), "".join(tail)
+
+
+def _write_if_changed(path: Path, data: bytes) -> bool:
+    """Write data to path unless it already holds identical bytes; returns whether it was written."""
+    if path.exists() and path.read_bytes() == data:
+        return False
+    path.write_bytes(data)
+    return True
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hard-link src to dst, copying when linking is not possible (e.g. across filesystems)."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _stage_build_context(agent_id: str, dockerfile_path: Path) -> Path:
+    """Create a temp build context holding only what the generated Dockerfile COPYs."""
+    ctx = Path(tempfile.mkdtemp(prefix=f"build-{agent_id}-"))
+    ignore = shutil.ignore_patterns("__pycache__", "*.pyc")
+    for rel in (Path("agents") / agent_id, Path("agent-sdk"), Path("config")):
+        shutil.copytree(repo_root / rel, ctx / rel, ignore=ignore, copy_function=_link_or_copy)
+    _link_or_copy(str(repo_root / "requirements.txt"), str(ctx / "requirements.txt"))
+    shutil.copy2(dockerfile_path, ctx / "Dockerfile")
+    return ctx
+
+
+_BUILDX_BUILDER = "ravp-builder"
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_builder():
+    """Create the persistent buildx builder once per process; returns its name, or None without buildx."""
+    quiet = {"stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL}
+    if subprocess.run(["docker", "buildx", "inspect", _BUILDX_BUILDER], **quiet).returncode == 0:
+        return _BUILDX_BUILDER
+    if subprocess.run(["docker", "buildx", "create", "--name", _BUILDX_BUILDER], **quiet).returncode == 0:
+        return _BUILDX_BUILDER
+    return None
+
+
+def _docker_build(agent_id: str, image: str, dockerfile_path: Path, push: bool = False) -> tuple:
+    """
+    Build image from a minimal staged context.
+    
+    Uses the persistent buildx builder when available; with push=True buildx streams
+    layers straight to the registry. Returns (returncode, last output lines, pushed).
+    """
+    ctx = _stage_build_context(agent_id, dockerfile_path)
+    builder = _ensure_builder()
+    if builder:
+        cmd = ["docker", "buildx", "build", "--builder", builder, "--push" if push else "--load"]
+    else:
+        cmd = ["docker", "build"]
+    try:
+        returncode, output = _run_streaming(cmd + ["-t", image, "-f", str(ctx / "Dockerfile"), str(ctx)])
+        return returncode, output, bool(builder and push)
+    finally:
+        shutil.rmtree(ctx, ignore_errors=True)
+
+
+def generate_dockerfile(agent_id: str, control_plane_url: str = "http://localhost:8010") -> str:
+    """Generate Dockerfile for agent."""
+    return _DOCKERFILE_TMPL.substitute(
+        base_image=_BASE_IMAGE, agent_id=agent_id, control_plane_url=control_plane_url
+    )
 
 
 def deploy_local(agent_id: str, port: int = 8080, image_tag: str = "latest", control_plane_url: str = "http://localhost:8010"):
@@ -78,28 +278,26 @@ def deploy_local(agent_id: str, port: int = 8080, image_tag: str = "latest", con
     dockerfile_content = generate_dockerfile(agent_id, control_plane_url)
     dockerfile_path = repo_root / f"Dockerfile.{agent_id}"
     
-    print(f"📝 Writing Dockerfile to {dockerfile_path}")
-    with open(dockerfile_path, "w") as f:
-        f.write(dockerfile_content)
+    if _write_if_changed(dockerfile_path, dockerfile_content.encode()):
+        print(f"📝 Wrote Dockerfile to {dockerfile_path}")
+    else:
+        print(f"📝 Dockerfile unchanged, reusing {dockerfile_path}")
     
     # Build image
     image_name = f"agent-{agent_id.lower()}"
     full_image = f"{image_name}:{image_tag}"
     
     print(f"🔨 Building Docker image: {full_image}")
-    build_cmd = ["docker", "build", "-t", full_image, "-f", str(dockerfile_path), str(repo_root)]
-    
-    result = subprocess.run(build_cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        print(f"❌ Docker build failed: {result.stderr}")
+    returncode, output, _ = _docker_build(agent_id, full_image, dockerfile_path)
+    if returncode != 0:
+        print(f"❌ Docker build failed: {output}")
         return False
     
     print(f"✓ Image built successfully")
     
-    # Stop existing container if running
+    # Stop and remove existing container if running (single CLI call)
     print(f"🛑 Stopping existing container (if any)...")
-    subprocess.run(["docker", "stop", agent_id], capture_output=True)
-    subprocess.run(["docker", "rm", agent_id], capture_output=True)
+    subprocess.run(["docker", "rm", "-f", agent_id], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     
     # Run container
     print(f"🚀 Starting container on port {port}...")
@@ -129,107 +327,25 @@ def generate_k8s_manifest(agent_id: str, project: str, cluster: str, namespace:
                          replicas: int = 1, port: int = 8080, control_plane_url: str = "http://control-plane:8010"):
     """Generate Kubernetes deployment manifest."""
     image_name = f"gcr.io/{project}/agent-{agent_id.lower()}:latest"
-    
-    manifest = {
-        "apiVersion": "apps/v1",
-        "kind": "Deployment",
-        "metadata": {
-            "name": agent_id,
-            "namespace": namespace,
-            "labels": {
-                "app": agent_id,
-                "component": "agent"
-            }
-        },
-        "spec": {
-            "replicas": replicas,
-            "selector": {
-                "matchLabels": {
-                    "app": agent_id
-                }
-            },
-            "template": {
-                "metadata": {
-                    "labels": {
-                        "app": agent_id
-                    }
-                },
-                "spec": {
-                    "containers": [{
-                        "name": agent_id,
-                        "image": image_name,
-                        "ports": [{
-                            "containerPort": port
-                        }],
-                        "env": [
-                            {
-                                "name": "CONTROL_PLANE_URL",
-                                "value": control_plane_url
-                            },
-                            {
-                                "name": "GOOGLE_API_KEY",
-                                "valueFrom": {
-                                    "secretKeyRef": {
-                                        "name": "agent-secrets",
-                                        "key": "google-api-key"
-                                    }
-                                }
-                            }
-                        ],
-                        "resources": {
-                            "requests": {
-                                "cpu": "100m",
-                                "memory": "256Mi"
-                            },
-                            "limits": {
-                                "cpu": "500m",
-                                "memory": "512Mi"
-                            }
-                        },
-                        "livenessProbe": {
-                            "httpGet": {
-                                "path": "/health",
-                                "port": port
-                            },
-                            "initialDelaySeconds": 30,
-                            "periodSeconds": 10
-                        },
-                        "readinessProbe": {
-                            "httpGet": {
-                                "path": "/health",
-                                "port": port
-                            },
-                            "initialDelaySeconds": 10,
-                            "periodSeconds": 5
-                        }
-                    }]
-                }
-            }
-        }
-    }
-    
-    service = {
-        "apiVersion": "v1",
-        "kind": "Service",
-        "metadata": {
-            "name": agent_id,
-            "namespace": namespace,
-            "labels": {
-                "app": agent_id
-            }
-        },
-        "spec": {
-            "type": "ClusterIP",
-            "ports": [{
-                "port": 80,
-                "targetPort": port,
-                "protocol": "TCP"
-            }],
-            "selector": {
-                "app": agent_id
-            }
-        }
-    }
+    labels = {"app": agent_id}
+    
+    manifest = copy.deepcopy(_DEPLOYMENT_TEMPLATE)
+    manifest["metadata"].update(name=agent_id, namespace=namespace)
+    manifest["metadata"]["labels"]["app"] = agent_id
+    manifest["spec"]["replicas"] = replicas
+    manifest["spec"]["selector"]["matchLabels"] = dict(labels)
+    manifest["spec"]["template"]["metadata"]["labels"] = dict(labels)
+    container = manifest["spec"]["template"]["spec"]["containers"][0]
+    container.update(name=agent_id, image=image_name)
+    container["ports"][0]["containerPort"] = port
+    container["env"][0]["value"] = control_plane_url
+    container["livenessProbe"]["httpGet"]["port"] = port
+    container["readinessProbe"]["httpGet"]["port"] = port
+    
+    service = copy.deepcopy(_SERVICE_TEMPLATE)
+    service["metadata"].update(name=agent_id, namespace=namespace, labels=dict(labels))
+    service["spec"]["ports"][0]["targetPort"] = port
+    service["spec"]["selector"] = dict(labels)
     
     return manifest, service
 
@@ -251,57 +367,79 @@ def deploy_gke(agent_id: str, project: str, cluster: str, namespace: str = "agen
     dockerfile_content = generate_dockerfile(agent_id, control_plane_url)
     dockerfile_path = repo_root / f"Dockerfile.{agent_id}"
     
-    print(f"📝 Writing Dockerfile to {dockerfile_path}")
-    with open(dockerfile_path, "w") as f:
-        f.write(dockerfile_content)
-    
-    # Build and push image
-    image_name = f"gcr.io/{project}/agent-{agent_id.lower()}"
+    if _write_if_changed(dockerfile_path, dockerfile_content.encode()):
+        print(f"📝 Wrote Dockerfile to {dockerfile_path}")
+    else:
+        print(f"📝 Dockerfile unchanged, reusing {dockerfile_path}")
     
-    if build_image:
-        print(f"🔨 Building Docker image: {image_name}")
-        build_cmd = ["docker", "build", "-t", f"{image_name}:latest", "-f", str(dockerfile_path), str(repo_root)]
+    # Set GCP project and get cluster credentials in the background while the image builds
+    print(f"🔧 Configuring GCP...")
+    # Output is captured so it does not interleave with the streamed docker log; shown only on failure
+    gcloud_procs = [
+        subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        for cmd in (
+            ["gcloud", "config", "set", "project", project],
+            ["gcloud", "container", "clusters", "get-credentials", cluster, "--project", project],
+        )
+    ]
+    try:
+        # Build and push image
+        image_name = f"gcr.io/{project}/agent-{agent_id.lower()}"
         
-        result = subprocess.run(build_cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            print(f"❌ Docker build failed: {result.stderr}")
-            return False
+        if build_image:
+            print(f"🔨 Building Docker image: {image_name}")
+            returncode, output, pushed = _docker_build(agent_id, f"{image_name}:latest", dockerfile_path, push=True)
+            if returncode != 0:
+                print(f"❌ Docker build failed: {output}")
+                print(f"   Make sure you're authenticated: gcloud auth configure-docker")
+                return False
+            
+            if not pushed:
+                print(f"📤 Pushing image to GCR...")
+                push_cmd = ["docker", "push", f"{image_name}:latest"]
+                
+                returncode, output = _run_streaming(push_cmd)
+                if returncode != 0:
+                    print(f"❌ Docker push failed: {output}")
+                    print(f"   Make sure you're authenticated: gcloud auth configure-docker")
+                    return False
+            
+            print(f"✓ Image pushed successfully")
         
-        print(f"📤 Pushing image to GCR...")
-        push_cmd = ["docker", "push", f"{image_name}:latest"]
+        # Generate Kubernetes manifests
+        deployment, service = generate_k8s_manifest(agent_id, project, cluster, namespace, replicas, port, control_plane_url)
         
-        result = subprocess.run(push_cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            print(f"❌ Docker push failed: {result.stderr}")
-            print(f"   Make sure you're authenticated: gcloud auth configure-docker")
-            return False
+        manifest_path = repo_root / f"{agent_id}-deployment.yaml"
+        yaml, _, safe_dumper = _yaml()
+        manifest_content = (
+            yaml.dump(deployment, Dumper=safe_dumper, default_flow_style=False, sort_keys=False)
+            + "---\n"
+            + yaml.dump(service, Dumper=safe_dumper, default_flow_style=False, sort_keys=False)
+        )
+        if _write_if_changed(manifest_path, manifest_content.encode()):
+            print(f"📝 Wrote Kubernetes manifest to {manifest_path}")
+        else:
+            print(f"📝 Kubernetes manifest unchanged, reusing {manifest_path}")
         
-        print(f"✓ Image pushed successfully")
-    
-    # Generate Kubernetes manifests
-    deployment, service = generate_k8s_manifest(agent_id, project, cluster, namespace, replicas, port, control_plane_url)
-    
-    manifest_path = repo_root / f"{agent_id}-deployment.yaml"
-    print(f"📝 Writing Kubernetes manifest to {manifest_path}")
-    
-    with open(manifest_path, "w") as f:
-        yaml.dump(deployment, f, default_flow_style=False, sort_keys=False)
-        f.write("---\n")
-        yaml.dump(service, f, default_flow_style=False, sort_keys=False)
-    
-    # Set GCP project and get cluster credentials
-    print(f"🔧 Configuring GCP...")
-    subprocess.run(["gcloud", "config", "set", "project", project], check=True)
-    subprocess.run(["gcloud", "container", "clusters", "get-credentials", cluster], check=True)
+        # Wait for GCP configuration started above
+        for proc in gcloud_procs:
+            output, _ = proc.communicate()
+            if proc.returncode != 0:
+                print(f"❌ {' '.join(proc.args)} failed: {output}")
+                raise subprocess.CalledProcessError(proc.returncode, proc.args, output=output)
+    finally:
+        # Don't leave gcloud running if we bail out before waiting on it
+        for proc in gcloud_procs:
+            if proc.poll() is None:
+                proc.terminate()
+                proc.wait()
     
     # Create namespace if not exists
     print(f"📦 Creating namespace {namespace}...")
-    subprocess.run([
-        "kubectl", "create", "namespace", namespace, "--dry-run=client", "-o", "yaml"
-    ], stdout=subprocess.PIPE)
+    namespace_manifest = {"apiVersion": "v1", "kind": "Namespace", "metadata": {"name": namespace}}
     subprocess.run([
         "kubectl", "apply", "-f", "-"
-    ], input=subprocess.PIPE, check=False)
+    ], input=yaml.dump(namespace_manifest, Dumper=safe_dumper, sort_keys=False), text=True, check=False)
     
     # Apply deployment
     print(f"🚀 Deploying to GKE...")
@@ -322,7 +460,24 @@ def deploy_gke(agent_id: str, project: str, cluster: str, namespace: str = "agen
     return True
 
 
-def main():
+# Fast-path CLI spec: flag -> (dest, type, default). Must stay in sync with _build_parser.
+_VALUE_FLAGS = {
+    "--agent": ("agent", str, None),
+    "--target": ("target", str, None),
+    "--port": ("port", int, 8080),
+    "--tag": ("tag", str, "latest"),
+    "--control-plane-url": ("control_plane_url", str, "http://localhost:8010"),
+    "--project": ("project", str, None),
+    "--cluster": ("cluster", str, None),
+    "--namespace": ("namespace", str, "agents"),
+    "--replicas": ("replicas", int, 1),
+}
+_SWITCH_FLAGS = {"--no-build": "no_build"}
+
+
+def _build_parser():
+    """Full argparse parser, used for --help and for reporting invalid arguments."""
+    import argparse
     parser = argparse.ArgumentParser(description="Deploy an agent")
     parser.add_argument("--agent", required=True, help="Agent ID to deploy")
     parser.add_argument("--target", required=True, choices=["local", "gke"], help="Deployment target")
@@ -338,14 +493,36 @@ def main():
     parser.add_argument("--namespace", default="agents", help="Kubernetes namespace")
     parser.add_argument("--replicas", type=int, default=1, help="Number of replicas")
     parser.add_argument("--no-build", action="store_true", help="Skip Docker build/push (use existing image)")
-    
-    args = parser.parse_args()
-    
+    return parser
+
+
+def _parse_args(argv: list):
+    """Parse well-formed argv without argparse; anything else (--help, errors) goes through _build_parser."""
+    values = {dest: default for dest, _, default in _VALUE_FLAGS.values()}
+    values.update((dest, False) for dest in _SWITCH_FLAGS.values())
+    tokens = iter(argv)
+    try:
+        for token in tokens:
+            if token in _SWITCH_FLAGS:
+                values[_SWITCH_FLAGS[token]] = True
+                continue
+            flag, has_value, value = token.partition("=")
+            dest, type_, _ = _VALUE_FLAGS[flag]
+            values[dest] = type_(value if has_value else next(tokens))
+    except (KeyError, StopIteration, ValueError):
+        return _build_parser().parse_args(argv)
+    if values["agent"] is None or values["target"] not in ("local", "gke"):
+        return _build_parser().parse_args(argv)
+    return types.SimpleNamespace(**values)
+
+
+def main():
+    args = _parse_args(sys.argv[1:])
     if args.target == "local":
         success = deploy_local(args.agent, args.port, args.tag, args.control_plane_url)
     elif args.target == "gke":
         if not args.project or not args.cluster:
-            parser.error("--project and --cluster are required for GKE deployment")
+            _build_parser().error("--project and --cluster are required for GKE deployment")
         success = deploy_gke(
             args.agent,
             args.project,
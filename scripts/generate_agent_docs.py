@@ -2,94 +2,159 @@
 """
 Generate documentation for all agents.
 
-Creates markdown documentation from agent definitions.
+Creates markdown documentation from agent definitions. Docs are only
+regenerated for definitions that changed since the last run (use --force to
+rebuild everything); parsed definitions are cached in .cache/agent_docs.pkl.
 """
 
+import argparse
+import functools
+import pickle
 import sys
 import yaml
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader as _SafeLoader
 
 repo_root = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(repo_root))
 
+# Section headings
+_H_OVERVIEW = "## Overview\n\n"
+_H_PURPOSE = "## Purpose\n\n"
+_H_OWNERS = "## Owners\n\n"
+_H_ALLOWED_TOOLS = "## Allowed Tools\n\n"
+_H_POLICIES = "## Policies\n\n"
+_H_CONFIGURATION = "## Configuration\n\n"
+
 
 def load_yaml(file_path: Path) -> Dict[str, Any]:
-    """Load YAML file."""
+    """Load YAML file (memoized on path and modification time)."""
+    return _load_yaml_cached(str(file_path), file_path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_yaml_cached(file_path: str, mtime_ns: int) -> Dict[str, Any]:
     with open(file_path, 'r') as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_SafeLoader)
 
 
 def generate_agent_doc(agent_id: str, definition: Dict[str, Any], output_dir: Path):
     """Generate documentation for a single agent."""
     output_file = output_dir / f"{agent_id}.md"
+    parts = [f"# {agent_id.replace('_', ' ').title()} Agent\n\n"]
+    
+    # Basic info
+    parts.append(_H_OVERVIEW)
+    parts.append(f"**Agent ID**: `{agent_id}`\n")
+    parts.append(f"**Version**: {definition.get('version', 'N/A')}\n")
+    parts.append(f"**Domain**: {definition.get('domain', 'N/A')}\n")
+    parts.append(f"**Risk Tier**: {definition.get('risk_tier', 'N/A')}\n\n")
+    
+    # Purpose
+    purpose = definition.get('purpose', {})
+    if purpose:
+        parts.append(_H_PURPOSE)
+        parts.append(f"**Goal**: {purpose.get('goal', 'N/A')}\n\n")
+        if purpose.get('instructions_prefix'):
+            parts.append("**Instructions**:\n\n")
+            parts.append(f"{purpose['instructions_prefix']}\n\n")
+    
+    # Owners
+    owners = definition.get('owners', {})
+    if owners:
+        parts.append(_H_OWNERS)
+        parts.append("".join(f"- **{role.title()}**: {name}\n" for role, name in owners.items()))
+        parts.append("\n")
+    
+    # Tools
+    allowed_tools = definition.get('allowed_tools', [])
+    if allowed_tools:
+        parts.append(_H_ALLOWED_TOOLS)
+        parts.append("".join(f"- `{tool}`\n" for tool in allowed_tools))
+        parts.append("\n")
+    
+    # Policies
+    policies = definition.get('policies', [])
+    if policies:
+        parts.append(_H_POLICIES)
+        parts.append("".join(f"- `{policy}`\n" for policy in policies))
+        parts.append("\n")
+    
+    # Configuration
+    parts.append(_H_CONFIGURATION)
+    parts.append(f"- **Model**: {definition.get('model', 'N/A')}\n")
+    parts.append(f"- **Confidence Threshold**: {definition.get('confidence_threshold', 'N/A')}\n")
+    parts.append(f"- **Human in the Loop**: {definition.get('human_in_the_loop', False)}\n")
     
-    with open(output_file, 'w') as f:
-        f.write(f"# {agent_id.replace('_', ' ').title()} Agent\n\n")
-        
-        # Basic info
-        f.write("## Overview\n\n")
-        f.write(f"**Agent ID**: `{agent_id}`\n")
-        f.write(f"**Version**: {definition.get('version', 'N/A')}\n")
-        f.write(f"**Domain**: {definition.get('domain', 'N/A')}\n")
-        f.write(f"**Risk Tier**: {definition.get('risk_tier', 'N/A')}\n\n")
-        
-        # Purpose
-        purpose = definition.get('purpose', {})
-        if purpose:
-            f.write("## Purpose\n\n")
-            f.write(f"**Goal**: {purpose.get('goal', 'N/A')}\n\n")
-            if purpose.get('instructions_prefix'):
-                f.write("**Instructions**:\n\n")
-                f.write(f"{purpose['instructions_prefix']}\n\n")
-        
-        # Owners
-        owners = definition.get('owners', {})
-        if owners:
-            f.write("## Owners\n\n")
-            for role, name in owners.items():
-                f.write(f"- **{role.title()}**: {name}\n")
-            f.write("\n")
-        
-        # Tools
-        allowed_tools = definition.get('allowed_tools', [])
-        if allowed_tools:
-            f.write("## Allowed Tools\n\n")
-            for tool in allowed_tools:
-                f.write(f"- `{tool}`\n")
-            f.write("\n")
-        
-        # Policies
-        policies = definition.get('policies', [])
-        if policies:
-            f.write("## Policies\n\n")
-            for policy in policies:
-                f.write(f"- `{policy}`\n")
-            f.write("\n")
-        
-        # Configuration
-        f.write("## Configuration\n\n")
-        f.write(f"- **Model**: {definition.get('model', 'N/A')}\n")
-        f.write(f"- **Confidence Threshold**: {definition.get('confidence_threshold', 'N/A')}\n")
-        f.write(f"- **Human in the Loop**: {definition.get('human_in_the_loop', False)}\n")
+    output_file.write_text("".join(parts), encoding="utf-8")
+
+
+def _process_one(agent_yaml: Path, output_dir: Path, definition: Optional[Dict[str, Any]] = None):
+    """Write the doc for one agent, loading its definition if not supplied; returns (agent_id, definition)."""
+    agent_id = agent_yaml.stem
+    if definition is None:
+        definition = load_yaml(agent_yaml)
+    generate_agent_doc(agent_id, definition, output_dir)
+    return agent_id, definition
+
+
+def _load_cache(cache_file: Path) -> Dict[Tuple[str, int], Dict[str, Any]]:
+    """Load the parsed-definition cache, keyed by (path, mtime_ns)."""
+    try:
+        return pickle.loads(cache_file.read_bytes())
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return {}
 
 
 def main():
     """Generate documentation for all agents."""
+    parser = argparse.ArgumentParser(description="Generate agent documentation")
+    parser.add_argument("--force", action="store_true", help="Regenerate docs even if they are up to date")
+    args = parser.parse_args()
+    
     print("📚 Generating agent documentation...\n")
     
     config_dir = repo_root / "config" / "agents"
     output_dir = repo_root / "docs" / "generated"
     output_dir.mkdir(parents=True, exist_ok=True)
+    cache_file = repo_root / ".cache" / "agent_docs.pkl"
+    cache = _load_cache(cache_file)
     
     agent_yamls = list(config_dir.glob("*.yaml"))
     agent_yamls = [f for f in agent_yamls if f.name != "template.yaml"]
     
+    new_cache = {}
+    pending = []
     for agent_yaml in agent_yamls:
-        agent_id = agent_yaml.stem
-        definition = load_yaml(agent_yaml)
-        generate_agent_doc(agent_id, definition, output_dir)
-        print(f"✓ Generated docs for {agent_id}")
+        key = (str(agent_yaml), agent_yaml.stat().st_mtime_ns)
+        output_file = output_dir / f"{agent_yaml.stem}.md"
+        if not args.force and key in cache and output_file.exists() and output_file.stat().st_mtime_ns >= key[1]:
+            new_cache[key] = cache[key]
+            print(f"✓ Docs up to date for {agent_yaml.stem}")
+            continue
+        pending.append((agent_yaml, key, cache.get(key)))
+    
+    if pending:
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(
+                _process_one,
+                [agent_yaml for agent_yaml, _, _ in pending],
+                [output_dir] * len(pending),
+                [definition for _, _, definition in pending],
+            )
+            for (_, key, _), (agent_id, definition) in zip(pending, results):
+                new_cache[key] = definition
+                print(f"✓ Generated docs for {agent_id}")
+    
+    if new_cache != cache:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(pickle.dumps(new_cache))
     
     print(f"\n✅ Documentation generated in {output_dir}")
 
@@ -16,62 +16,140 @@ Options:
   --base-url-env  Env var name for API base URL (default: from spec servers[0] or API_BASE_URL)
   --dry-run    Print what would be created without writing files
   --prefix     Optional prefix for tool IDs (e.g. myapi_)
+
+Specs fetched over HTTP are cached in ~/.cache/ravp/openapi and revalidated with
+ETag / Last-Modified on the next run.
 """
 
 import argparse
+import gzip
+import hashlib
+import itertools
 import json
+import os
 import re
+import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
 repo_root = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(repo_root))
 
+# HTTP specs are cached here (body + ETag/Last-Modified) for conditional re-fetches
+_SPEC_CACHE_DIR = Path.home() / ".cache" / "ravp" / "openapi"
+
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+
+try:
+    from orjson import loads as _json_loads  # parses bytes directly
+except ImportError:
+    _json_loads = json.loads
+
+_SLUG_INVALID_RE = re.compile(r"[^a-zA-Z0-9/_\-]")
+_SLUG_REPEAT_RE = re.compile(r"_+")
+_PATH_PARAM_RE = re.compile(r"\{([^}]+)\}")
+
+_HTTP_METHODS = ("get", "post", "put", "patch", "delete")
+_HTTP_METHODS_SET = frozenset(_HTTP_METHODS)
+_BODY_METHODS = frozenset({"post", "put", "patch"})
+# OpenAPI parameter "in" -> our param_in; anything else (header, cookie, ...) maps to query
+_PARAM_IN_MAP = {"path": "path", "query": "query", "body": "body"}
+
+
+class _NoAliasDumper(_SafeDumper):
+    """Dump shared objects (e.g. a spec's data_sources list) inline instead of as YAML anchors."""
+
+    def ignore_aliases(self, data):
+        return True
+
 
 def load_spec(spec_ref: str) -> dict:
     """Load OpenAPI spec from URL or file. Returns parsed dict."""
     spec_ref = spec_ref.strip()
     if spec_ref.startswith(("http://", "https://")):
         try:
-            import urllib.request
-            with urllib.request.urlopen(spec_ref, timeout=15) as r:
-                raw = r.read().decode()
+            path = _fetch_spec(spec_ref)
         except Exception as e:
             raise SystemExit(f"Failed to fetch spec: {e}")
     else:
         path = Path(spec_ref)
         if not path.exists():
             raise SystemExit(f"File not found: {path}")
-        raw = path.read_text()
-    if spec_ref.endswith(".yaml") or spec_ref.endswith(".yml") or ":" in raw.split("\n")[0]:
-        return yaml.safe_load(raw) or {}
-    return json.loads(raw)
+    with path.open("rb") as f:
+        return _parse_spec_stream(f, spec_ref)
+
+
+def _fetch_spec(url: str) -> Path:
+    """
+    Download a spec into the local cache and return the cached body's path.
+    Requests gzip and revalidates with ETag / Last-Modified, so an unchanged spec is a 304.
+    """
+    import urllib.error
+    import urllib.request
+
+    key = hashlib.sha1(url.encode()).hexdigest()
+    body_path = _SPEC_CACHE_DIR / f"{key}.body"
+    meta_path = _SPEC_CACHE_DIR / f"{key}.meta"
+    headers = {"Accept-Encoding": "gzip"}
+    if body_path.exists() and meta_path.exists():
+        meta = json.loads(meta_path.read_text())
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+    try:
+        r = urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=15)
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return body_path
+        raise
+    with r:
+        body = gzip.GzipFile(fileobj=r) if r.headers.get("Content-Encoding") == "gzip" else r
+        _SPEC_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = _SPEC_CACHE_DIR / f"{key}.tmp"
+        with open(tmp_path, "wb") as f:
+            shutil.copyfileobj(body, f)
+        os.replace(tmp_path, body_path)
+        meta_path.write_text(json.dumps({"etag": r.headers.get("ETag"), "last_modified": r.headers.get("Last-Modified")}))
+    return body_path
+
+
+def _parse_spec_stream(stream, spec_ref: str) -> dict:
+    """Parse a JSON or YAML spec straight from a buffered binary stream."""
+    if spec_ref.endswith(".json"):
+        return _json_loads(stream.read())
+    if not spec_ref.endswith((".yaml", ".yml")):
+        # Sniff only the first line of the buffered head: YAML has a "key:" there, JSON starts with "{"
+        head = stream.peek(256)
+        newline = head.find(b"\n")
+        if b":" not in (head if newline == -1 else head[:newline]):
+            return _json_loads(stream.read())
+    return yaml.load(stream, Loader=_SafeLoader) or {}
 
 
 def slug_to_tool_id(s: str) -> str:
     """Convert operationId or path to a safe tool_id (snake_case)."""
-    s = re.sub(r"[^a-zA-Z0-9/_\-]", "_", s)
+    s = _SLUG_INVALID_RE.sub("_", s)
     s = s.strip("_").lower()
-    s = re.sub(r"_+", "_", s)
+    s = _SLUG_REPEAT_RE.sub("_", s)
     return s or "unknown"
 
 
 def get_path_params(path_str: str) -> list[str]:
     """Extract {param} names from path string."""
-    return re.findall(r"\{([^}]+)\}", path_str)
+    return _PATH_PARAM_RE.findall(path_str)
 
 
 def openapi_param_in_to_ours(in_val: str) -> str:
     """Map OpenAPI parameter 'in' to our param_in (path, query, body)."""
-    if in_val == "path":
-        return "path"
-    if in_val == "query":
-        return "query"
-    if in_val == "body":
-        return "body"
-    return "query"
+    return _PARAM_IN_MAP.get(in_val, "query")
 
 
 def generate_tools_from_spec(
@@ -86,43 +164,36 @@ def generate_tools_from_spec(
     """
     tools = []
     paths = spec.get("paths") or {}
+    # One list shared by every tool from this spec; it is only ever serialized
+    data_sources = [(spec.get("info") or {}).get("title") or "API"]
     # OpenAPI 3 has components; Swagger 2 might have parameters at path level
     for path_pattern, path_item in paths.items():
-        if not isinstance(path_item, dict):
+        # Skip path items with no operations (only parameters, summary, $ref, ...)
+        if type(path_item) is not dict or _HTTP_METHODS_SET.isdisjoint(path_item):
             continue
-        for method in ("get", "post", "put", "patch", "delete"):
+        for method in _HTTP_METHODS:
             op = path_item.get(method)
             if not op or not isinstance(op, dict):
                 continue
             operation_id = op.get("operationId") or f"{method}_{path_pattern.strip('/').replace('/', '_')}"
             tool_id = slug_to_tool_id(prefix + operation_id)
-            description = (op.get("summary") or op.get("description") or f"{method.upper()} {path_pattern}").strip()[:500]
+            method_upper = method.upper()
+            description = (op.get("summary") or op.get("description") or f"{method_upper} {path_pattern}").strip()[:500]
 
             # Build path_template: ensure path params use {name}
             path_template = path_pattern
             if not path_template.startswith("/"):
                 path_template = "/" + path_template
 
-            # Collect parameters from path, path item, and operation
-            params_spec = []
-            seen = set()
+            # Collect parameters from path, path item, and operation (first occurrence of a name wins)
+            params_by_name: dict[str, dict] = {}
 
-            # Path-level parameters
-            for p in path_item.get("parameters") or []:
-                if isinstance(p, dict) and p.get("name") and p["name"] not in seen:
-                    seen.add(p["name"])
-                    params_spec.append({
-                        "name": p["name"],
-                        "param_in": openapi_param_in_to_ours(p.get("in", "query")),
-                        "required": p.get("required", False),
-                    })
-            # Operation-level parameters
-            for p in op.get("parameters") or []:
-                if isinstance(p, dict) and p.get("name") and p["name"] not in seen:
-                    seen.add(p["name"])
-                    params_spec.append({
+            # Path-level, then operation-level parameters
+            for p in itertools.chain(path_item.get("parameters") or [], op.get("parameters") or []):
+                if isinstance(p, dict) and p.get("name"):
+                    params_by_name.setdefault(p["name"], {
                         "name": p["name"],
-                        "param_in": openapi_param_in_to_ours(p.get("in", "query")),
+                        "param_in": _PARAM_IN_MAP.get(p.get("in"), "query"),
                         "required": p.get("required", False),
                     })
 
@@ -130,28 +201,27 @@ def generate_tools_from_spec(
             req_body = op.get("requestBody") or {}
             if isinstance(req_body, dict) and req_body.get("content"):
                 # We don't map schema to a single param name; use a generic "body" or leave to executor
-                if "body" not in seen and method in ("post", "put", "patch"):
-                    params_spec.append({"name": "body", "param_in": "body", "required": req_body.get("required", False)})
-                    seen.add("body")
+                if method in _BODY_METHODS:
+                    params_by_name.setdefault("body", {"name": "body", "param_in": "body", "required": req_body.get("required", False)})
 
             # Ensure path params are in params_spec
             for pname in get_path_params(path_template):
-                if pname not in seen:
-                    params_spec.append({"name": pname, "param_in": "path", "required": True})
-                    seen.add(pname)
+                params_by_name.setdefault(pname, {"name": pname, "param_in": "path", "required": True})
+
+            params_spec = list(params_by_name.values())
 
             tool_def = {
                 "tool_id": tool_id,
                 "domain": domain,
                 "version": "1.0.0",
                 "description": description,
-                "data_sources": [spec.get("info", {}).get("title", "API") or "API"],
+                "data_sources": data_sources,
                 "pii_level": "low",
                 "risk_tier": "low",
                 "requires_human_approval": False,
                 "implementation_type": "api",
                 "api_config": {
-                    "method": method.upper(),
+                    "method": method_upper,
                     "base_url_env": base_url_env,
                     "path_template": path_template,
                     "timeout_seconds": 10,
@@ -162,8 +232,12 @@ def generate_tools_from_spec(
     return tools
 
 
-def write_tool_to_disk(tool_def: dict, tools_base: Path, flat_tools: dict) -> None:
-    """Write one tool to config/tools/{domain}/{tool_id}/1.0.0.yaml and add to flat_tools."""
+def write_tool_to_disk(tool_def: dict, tools_base: Path, flat_tools: Optional[dict] = None) -> dict:
+    """
+    Write one tool to config/tools/{domain}/{tool_id}/1.0.0.yaml and return its registry entry
+    (also added to flat_tools when given). tool_ids may contain "/" (e.g. GitHub's "repos/get"),
+    so intermediate directories are created as needed. Safe to call concurrently for distinct tool_ids.
+    """
     domain = tool_def["domain"]
     tool_id = tool_def["tool_id"]
     tool_dir = tools_base / domain / tool_id
@@ -182,15 +256,22 @@ def write_tool_to_disk(tool_def: dict, tools_base: Path, flat_tools: dict) -> No
         "metadata": {"created_at": "import", "created_by": "import_openapi_tools"},
     }
     version_file = tool_dir / "1.0.0.yaml"
-    with open(version_file, "w") as f:
-        yaml.dump(out, f, default_flow_style=False, sort_keys=False)
-    flat_tools[tool_id] = {
+    data = yaml.dump(out, Dumper=_NoAliasDumper, default_flow_style=False, sort_keys=False).encode()
+    # Leave unchanged files (and their mtimes) alone on re-import
+    if not version_file.exists() or version_file.read_bytes() != data:
+        tmp_file = tool_dir / "1.0.0.yaml.tmp"
+        tmp_file.write_bytes(data)
+        os.replace(tmp_file, version_file)
+    entry = {
         "description": tool_def["description"],
         "data_sources": tool_def["data_sources"],
         "pii_level": tool_def["pii_level"],
         "risk_tier": tool_def["risk_tier"],
         "requires_human_approval": tool_def["requires_human_approval"],
     }
+    if flat_tools is not None:
+        flat_tools[tool_id] = entry
+    return entry
 
 
 def main():
@@ -233,14 +314,19 @@ def main():
     registry_path = repo_root / "config" / "tool_registry.yaml"
     if registry_path.exists():
         with open(registry_path) as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_SafeLoader) or {}
         flat_tools = dict(data.get("tools") or {})
+    existing_tools = dict(flat_tools)
 
-    for t in tools:
-        write_tool_to_disk(t, tools_base, flat_tools)
+    # Operations that slug to the same tool_id: keep the last definition (as sequential writes did)
+    unique_tools = {t["tool_id"]: t for t in tools}
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4)) as executor:
+        entries = executor.map(lambda t: write_tool_to_disk(t, tools_base), unique_tools.values())
+        flat_tools.update(zip(unique_tools, entries))
 
-    with open(registry_path, "w") as f:
-        yaml.dump({"tools": flat_tools}, f, default_flow_style=False, sort_keys=False)
+    if flat_tools != existing_tools or not registry_path.exists():
+        with open(registry_path, "w") as f:
+            yaml.dump({"tools": flat_tools}, f, Dumper=_NoAliasDumper, default_flow_style=False, sort_keys=False)
     print(f"\nWrote {len(tools)} tool(s) under config/tools/{args.domain}/ and updated config/tool_registry.yaml")
     print(f"Set env: {args.base_url_env}=<your API base URL> and add tool names to agents' allowed_tools.")
     return 0
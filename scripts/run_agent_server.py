@@ -2,23 +2,32 @@
 """
 Start an agent's HTTP server by importing its FastAPI app and running uvicorn.
 Avoids runpy and __name__ issues that can prevent the server from starting in containers.
+The app is handed to uvicorn as an import string so WEB_CONCURRENCY workers can be spawned.
 Usage: python scripts/run_agent_server.py <agent_id>
 Example: python scripts/run_agent_server.py cloud_reliability
 """
 import importlib
+import os
 import sys
 
-if len(sys.argv) < 2:
-    print("Usage: python run_agent_server.py <agent_id>", file=sys.stderr)
-    sys.exit(1)
+# Required: uvicorn spawns workers that re-run this script, which must not start servers again.
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python run_agent_server.py <agent_id>", file=sys.stderr)
+        sys.exit(1)
 
-agent_id = sys.argv[1]
-module_name = f"agents.{agent_id}.agent"
-mod = importlib.import_module(module_name)
-app = getattr(mod, "app", None)
-if app is None:
-    print(f"Module {module_name} has no 'app' attribute", file=sys.stderr)
-    sys.exit(1)
+    agent_id = sys.argv[1]
+    module_name = f"agents.{agent_id}.agent"
+    mod = importlib.import_module(module_name)
+    app = getattr(mod, "app", None)
+    if app is None:
+        print(f"Module {module_name} has no 'app' attribute", file=sys.stderr)
+        sys.exit(1)
 
-import uvicorn
-uvicorn.run(app, host="0.0.0.0", port=8080)
+    import uvicorn
+    uvicorn.run(
+        f"{module_name}:app",
+        host="0.0.0.0",
+        port=8080,
+        workers=int(os.environ.get("WEB_CONCURRENCY", "1")),
+    )
@@ -21,6 +21,7 @@ from kill_switch.state import (
     is_agent_disabled,
     is_model_disabled,
     list_disabled,
+    snapshot,
 )
 
 
@@ -98,6 +99,10 @@ def test_list_disabled():
     print(f"Disabled models: {disabled['models']}")
     print()
     
+    state = snapshot()
+    assert {"payment_failed", "test_agent"} <= state["agents"], "Agents should be disabled"
+    assert "gemini-1.5-pro" in state["models"], "Model should be disabled"
+    
     # Clean up
     enable_agent("payment_failed")
     enable_agent("test_agent")
@@ -107,6 +112,10 @@ def test_list_disabled():
     print(f"After cleanup - Disabled agents: {disabled['agents']}")
     print(f"After cleanup - Disabled models: {disabled['models']}")
     print()
+    
+    state = snapshot()
+    assert not state["agents"] & {"payment_failed", "test_agent"}, "Agents should be enabled"
+    assert "gemini-1.5-pro" not in state["models"], "Model should be enabled"
 
 
 if __name__ == "__main__":
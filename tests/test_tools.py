@@ -4,10 +4,14 @@ Test script for Tools.
 Run this to verify the tools are working.
 """
 
+import importlib
 import sys
 import json
+import types
 from pathlib import Path
 
+import pytest
+
 # Add repo root to path
 repo_root = Path(__file__).resolve().parent.parent
 if str(repo_root) not in sys.path:
@@ -44,6 +48,108 @@ def test_get_payment_exception():
     print()
 
 
+def test_get_payment_exceptions():
+    """Test get_payment_exceptions batch tool."""
+    print("=" * 60)
+    print("Testing: get_payment_exceptions")
+    print("=" * 60)
+    
+    from tools.mcp_payment_tools import get_payment_exception, get_payment_exceptions
+    
+    # Test case 1: Mixed valid, invalid and duplicate IDs
+    print("\nTest Case 1: Mixed IDs")
+    ids = ["EX-2025-001", "EX-9999-999", "EX-2025-001"]
+    results = get_payment_exceptions(ids)
+    print(f"  Input: {ids}")
+    print(f"  Result keys: {list(results)}")
+    assert list(results) == ["EX-2025-001", "EX-9999-999"], "Should return one result per unique ID"
+    for exception_id, result in results.items():
+        assert json.loads(result) == json.loads(get_payment_exception(exception_id)), "Should match single fetch"
+    print("  ✅ Passed")
+    print()
+
+
+
+@pytest.fixture
+def payment_api(monkeypatch):
+    """Point get_payment_exception at a stubbed API; yields (module, requested URLs, status by id)."""
+    payment_module = importlib.import_module("tools.mcp_payment_tools.get_payment_exception")
+    statuses = {}
+    requested = []
+    
+    def fake_get(url, headers=None, timeout=None):
+        requested.append(url)
+        exception_id = url.rsplit("/", 1)[-1]
+        status = statuses.get(exception_id, 200)
+        return types.SimpleNamespace(
+            status_code=status,
+            content=json.dumps({"id": exception_id, "status": "open"}).encode(),
+        )
+    
+    monkeypatch.setenv("PAYMENT_EXCEPTIONS_API_URL", "https://payments.test/exceptions")
+    monkeypatch.delenv("PAYMENT_CACHE_TTL", raising=False)
+    monkeypatch.setattr(payment_module._SESSION, "get", fake_get)
+    payment_module._config.cache_clear()
+    payment_module._CACHE.clear()
+    yield payment_module, requested, statuses
+    payment_module._config.cache_clear()
+    payment_module._CACHE.clear()
+
+
+def test_payment_exception_api_cache(payment_api, monkeypatch):
+    """Successful API responses are reused until they expire; errors are not cached."""
+    payment_module, requested, statuses = payment_api
+    now = [1000.0]
+    monkeypatch.setattr(payment_module, "time", types.SimpleNamespace(monotonic=lambda: now[0]))
+    
+    first = payment_module.get_payment_exception("EX-1")
+    assert json.loads(first)["exception_id"] == "EX-1", "Should normalise id to exception_id"
+    assert payment_module.get_payment_exception("EX-1") == first
+    assert len(requested) == 1, "Second call should be served from the cache"
+    
+    now[0] += 31
+    payment_module.get_payment_exception("EX-1")
+    assert len(requested) == 2, "Expired entry should be fetched again"
+    
+    statuses.update({"EX-404": 404, "EX-500": 500})
+    for exception_id in ("EX-404", "EX-500"):
+        payment_module.get_payment_exception(exception_id)
+        assert "error" in json.loads(payment_module.get_payment_exception(exception_id))
+    assert len(requested) == 6, "404 and 5xx responses should not be cached"
+    
+    monkeypatch.setattr(payment_module, "_CACHE_MAXSIZE", 2)
+    for exception_id in ("EX-2", "EX-3"):
+        payment_module.get_payment_exception(exception_id)
+    assert list(payment_module._CACHE) == [
+        ("https://payments.test/exceptions", "EX-2"),
+        ("https://payments.test/exceptions", "EX-3"),
+    ], "Least recently used entry should be evicted"
+
+
+def test_payment_exception_api_cache_disabled(payment_api, monkeypatch):
+    """PAYMENT_CACHE_TTL=0 sends every lookup to the API."""
+    payment_module, requested, _ = payment_api
+    monkeypatch.setenv("PAYMENT_CACHE_TTL", "0")
+    payment_module._config.cache_clear()
+    
+    payment_module.get_payment_exception("EX-1")
+    payment_module.get_payment_exception("EX-1")
+    assert len(requested) == 2
+    assert not payment_module._CACHE
+
+
+def test_get_payment_exceptions_api(payment_api):
+    """Batch lookups against the API return one result per unique id, each fetched once."""
+    payment_module, requested, statuses = payment_api
+    statuses["EX-404"] = 404
+    ids = ["EX-1", "EX-2", "EX-404", "EX-1", "EX-3"]
+    
+    results = payment_module.get_payment_exceptions(ids)
+    assert list(results) == ["EX-1", "EX-2", "EX-404", "EX-3"], "Should keep first-seen order"
+    assert sorted(requested) == sorted(f"https://payments.test/exceptions/{i}" for i in results)
+    assert json.loads(results["EX-2"])["exception_id"] == "EX-2"
+    assert json.loads(results["EX-404"])["error"] == "Exception not found"
+
 def test_suggest_payment_resolution():
     """Test suggest_payment_resolution tool."""
     print("=" * 60)
@@ -113,6 +219,45 @@ def test_get_customer_profile():
     print()
 
 
+def test_get_customer_profile_large_file_matches_small(tmp_path, monkeypatch):
+    """Large (offset-indexed) and small (in-memory) customers.json paths return the same results."""
+    # The package re-exports the function under the module's name, so import the module explicitly
+    profile_module = importlib.import_module("tools.mcp_customer_tools.get_customer_profile")
+    
+    records = [
+        {"customer_id": "CUST-7001", "name": "Ada", "tier": "gold"},
+        {"customer_id": "CUST-ÜNI", "name": "Jürgen Müller", "city": "Zürich"},
+        {"customer_id": "CUST-7002", "name": "Bracket ] and, comma", "note": "[x], {y}"},
+        {"customer_id": "CUST-7001", "name": "Duplicate (ignored)"},
+        {"customer_id": "CUST-Ω", "name": "Above latin-1"},
+    ]
+    ids = ("CUST-7001", "CUST-ÜNI", "CUST-7002", "CUST-Ω", "CUST-9999")
+    default_threshold = profile_module._MMAP_THRESHOLD
+    
+    def lookup_all(threshold):
+        monkeypatch.setattr(profile_module, "_MMAP_THRESHOLD", threshold)
+        profile_module._load_customers.cache_clear()
+        profile_module._index_large_customers.cache_clear()
+        return {cid: json.loads(profile_module.get_customer_profile(cid)) for cid in ids}
+    
+    # Raw UTF-8 and \u-escaped non-ASCII ids (stdlib json.dump's default)
+    for ensure_ascii in (False, True):
+        customers_path = tmp_path / f"customers_{ensure_ascii}.json"
+        customers_path.write_text(json.dumps(records, indent=2, ensure_ascii=ensure_ascii), encoding="utf-8")
+        monkeypatch.setattr(profile_module, "_CUSTOMERS_PATH", str(customers_path))
+        
+        small = lookup_all(default_threshold)
+        large = lookup_all(0)
+        profile_module._index_large_customers.cache_clear()
+        
+        assert large == small
+        assert small["CUST-7001"]["name"] == "Ada"
+        assert small["CUST-ÜNI"]["city"] == "Zürich"
+        assert small["CUST-7002"]["note"] == "[x], {y}"
+        assert small["CUST-Ω"]["name"] == "Above latin-1"
+        assert small["CUST-9999"]["error"] == "Customer not found"
+
+
 def test_tool_imports():
     """Test that tools can be imported correctly."""
     print("=" * 60)
@@ -141,6 +286,7 @@ if __name__ == "__main__":
     
     test_tool_imports()
     test_get_payment_exception()
+    test_get_payment_exceptions()
     test_suggest_payment_resolution()
     test_get_customer_profile()
     
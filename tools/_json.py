@@ -0,0 +1,111 @@
+"""
+JSON encoding for tool modules: orjson when installed, stdlib json otherwise.
+
+Both backends produce the same layout (compact, or 2-space indent) so tool
+output does not depend on which one is available. Output is compact unless
+RAVP_PRETTY_JSON is 1/true/yes when the process starts. Dataclass instances are
+serialized as objects of their fields.
+"""
+
+import dataclasses
+import functools
+import json
+import mmap
+import os
+import tempfile
+
+try:
+    import orjson
+except ImportError:  # orjson not installed
+    orjson = None
+
+_PRETTY = os.environ.get("RAVP_PRETTY_JSON", "").lower() in ("1", "true", "yes")
+
+# Data files larger than this are parsed straight from a memory map (orjson only)
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def _default(obj):
+    """Stdlib fallback for types orjson serializes natively (dataclasses)."""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def loads(data: str | bytes):
+    """Parse JSON from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj, indent: bool | None = None) -> str:
+    """Serialize obj to a JSON string (indent=None follows RAVP_PRETTY_JSON)."""
+    if indent is None:
+        indent = _PRETTY
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=_default)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_default)
+
+
+def dumps_bytes(obj, indent: bool | None = None) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes (for writing files opened in "wb")."""
+    if indent is None:
+        indent = _PRETTY
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return dumps(obj, indent).encode()
+
+
+def write_file(path: str | os.PathLike, obj) -> None:
+    """Write obj as compact JSON, atomically replacing path (parent dirs are created)."""
+    path = os.fspath(path)
+    parent = os.path.dirname(path)
+    os.makedirs(parent, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(dumps_bytes(obj, indent=False))
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def load_file(path: str | os.PathLike):
+    """
+    Parse a JSON data file, memoized on path and modification time.
+
+    The parsed object is shared between callers and must not be mutated.
+    """
+    path = os.fspath(path)
+    return _load_file_cached(path, os.stat(path).st_mtime_ns)
+
+
+def load_index(path: str | os.PathLike, key: str) -> dict:
+    """
+    Index a JSON file holding a list of records by record[key] (first record wins).
+
+    Memoized like load_file; the index and its records must not be mutated.
+    """
+    path = os.fspath(path)
+    return _load_index_cached(path, os.stat(path).st_mtime_ns, key)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_file_cached(path: str, mtime_ns: int):
+    with open(path, "rb") as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        return loads(f.read())
+
+
+@functools.lru_cache(maxsize=8)
+def _load_index_cached(path: str, mtime_ns: int, key: str) -> dict:
+    index = {}
+    for record in _load_file_cached(path, mtime_ns):
+        index.setdefault(record.get(key), record)
+    return index
@@ -5,9 +5,10 @@ In production, this would integrate with Calendar, Google Meet, or a runbook
 system to create events and notify participants.
 """
 
-import json
 from typing import List
 
+from .._json import dumps
+
 
 def request_meeting(
     participants: str | List[str],
@@ -28,20 +29,22 @@ def request_meeting(
         incident_id: Optional incident ID this meeting is about.
 
     Returns:
-        JSON string with status and details.
+        JSON string with status and details. Compact by default; set
+        RAVP_PRETTY_JSON=1 for indented output.
     """
     if isinstance(participants, str):
-        parts = [p.strip() for p in participants.split(",") if p.strip()]
+        parts = list(filter(None, (p.strip() for p in participants.split(","))))
     else:
         parts = list(participants) if participants else []
+    joined = ", ".join(parts) or "none"
 
     result = {
         "status": "requested",
-        "message": f"Meeting requested: '{title}' with participants: {', '.join(parts) or 'none'}.",
+        "message": f"Meeting requested: '{title}' with participants: {joined}.",
         "title": title,
         "participants": parts,
         "agenda": agenda,
         "incident_id": incident_id,
         "note": "In production this would create a calendar event and send invites to humans and/or notify agent runbooks.",
     }
-    return json.dumps(result, indent=2)
+    return dumps(result)
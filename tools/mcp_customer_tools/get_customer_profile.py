@@ -4,10 +4,55 @@ MCP-style tool: get customer profile from CoreBankingSystem/CustomerDataSystem.
 Authority boundary: only this module talks to customer data.
 """
 
+import functools
 import json
+import mmap
+import os
+import re
 from pathlib import Path
 
+from .._json import dumps, loads
+
 _DATA_DIR = Path(__file__).resolve().parent.parent.parent / "data" / "synthetic"
+_CUSTOMERS_PATH = str(_DATA_DIR / "customers.json")
+
+# Above this size customers.json is indexed by byte offset instead of held in memory
+_MMAP_THRESHOLD = 8 * 1024 * 1024
+_SEP_RE = re.compile(r"[\s,]*")
+
+
+@functools.lru_cache(maxsize=1)
+def _load_customers(mtime: float) -> dict[str, str]:
+    """Map customer_id to its serialized profile (cached until the file's mtime changes)."""
+    with open(_CUSTOMERS_PATH, "rb") as f:
+        records = loads(f.read())
+    index = {}
+    for record in records:
+        customer_id = record.get("customer_id")
+        if customer_id not in index:
+            index[customer_id] = dumps(record)
+    return index
+
+
+@functools.lru_cache(maxsize=1)
+def _index_large_customers(mtime: float) -> tuple[mmap.mmap, dict[str, tuple[int, int]]]:
+    """Map customer_id to the byte span of its record in a memory-mapped customers.json."""
+    with open(_CUSTOMERS_PATH, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    # latin-1 maps each byte to one code point, so string offsets are byte offsets
+    text = mm[:].decode("latin-1")
+    decoder = json.JSONDecoder()
+    index = {}
+    pos = _SEP_RE.match(text, text.index("[") + 1).end()
+    while text[pos] != "]":
+        record, end = decoder.raw_decode(text, pos)
+        customer_id = record.get("customer_id")
+        if isinstance(customer_id, str) and not customer_id.isascii():
+            # Non-ASCII ids may be raw UTF-8 or \u escapes; re-parse the record's bytes as UTF-8
+            customer_id = loads(mm[pos:end]).get("customer_id")
+        index.setdefault(customer_id, (pos, end))
+        pos = _SEP_RE.match(text, end).end()
+    return mm, index
 
 
 def get_customer_profile(customer_id: str) -> str:
@@ -22,24 +67,28 @@ def get_customer_profile(customer_id: str) -> str:
         customer_id: Customer identifier (e.g. "CUST-7001")
     
     Returns:
-        JSON string of customer record, or error message if not found
+        JSON string of customer record, or error message if not found.
+        Compact by default; set RAVP_PRETTY_JSON=1 for indented output.
     """
-    path = _DATA_DIR / "customers.json"
-    
-    if not path.exists():
-        return json.dumps({
+    try:
+        st = os.stat(_CUSTOMERS_PATH)
+    except FileNotFoundError:
+        return dumps({
             "error": "Data not found",
             "customer_id": customer_id
         })
     
-    with open(path, "r") as f:
-        records = json.load(f)
-    
-    for record in records:
-        if record.get("customer_id") == customer_id:
-            return json.dumps(record, indent=2)
+    if st.st_size >= _MMAP_THRESHOLD:
+        mm, index = _index_large_customers(st.st_mtime)
+        span = index.get(customer_id)
+        if span is not None:
+            return dumps(loads(mm[span[0]:span[1]]))
+    else:
+        profile = _load_customers(st.st_mtime).get(customer_id)
+        if profile is not None:
+            return profile
     
-    return json.dumps({
+    return dumps({
         "error": "Customer not found",
         "customer_id": customer_id
     })
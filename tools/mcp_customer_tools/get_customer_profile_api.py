@@ -5,12 +5,13 @@ This is an example showing how to use public APIs instead of JSON files.
 Set USE_API=true environment variable to enable.
 """
 
-import json
 import os
 import requests
 from pathlib import Path
 from typing import Optional
 
+from .._json import dumps, loads
+
 # Configuration
 USE_API = os.getenv("USE_API", "false").lower() == "true"
 API_BASE_URL = os.getenv("CUSTOMER_API_URL", "https://jsonplaceholder.typicode.com")
@@ -48,14 +49,14 @@ def get_customer_profile(customer_id: str) -> str:
             if response.status_code == 200:
                 api_data = response.json()
                 # Transform API response to our standard format
-                return json.dumps(_transform_api_response(api_data), indent=2)
+                return dumps(_transform_api_response(api_data))
             elif response.status_code == 404:
-                return json.dumps({
+                return dumps({
                     "error": "Customer not found in API",
                     "customer_id": customer_id
                 })
             else:
-                return json.dumps({
+                return dumps({
                     "error": f"API returned status {response.status_code}",
                     "customer_id": customer_id
                 })
@@ -115,19 +116,19 @@ def _get_from_file(customer_id: str) -> str:
     path = _DATA_DIR / "customers.json"
     
     if not path.exists():
-        return json.dumps({
+        return dumps({
             "error": "Data not found",
             "customer_id": customer_id
         })
     
-    with open(path, "r") as f:
-        records = json.load(f)
+    with open(path, "rb") as f:
+        records = loads(f.read())
     
     for record in records:
         if record.get("customer_id") == customer_id:
-            return json.dumps(record, indent=2)
+            return dumps(record)
     
-    return json.dumps({
+    return dumps({
         "error": "Customer not found",
         "customer_id": customer_id
     })
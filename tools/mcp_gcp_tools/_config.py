@@ -0,0 +1,15 @@
+"""
+GCP settings shared by the reliability tools.
+"""
+
+import functools
+import os
+
+
+@functools.lru_cache(maxsize=1)
+def project_id() -> str:
+    """
+    GCP_PROJECT_ID, read once per process so every tool queries the same project
+    (call project_id.cache_clear() after changing it).
+    """
+    return os.environ.get("GCP_PROJECT_ID", "").strip()
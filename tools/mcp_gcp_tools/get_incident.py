@@ -2,9 +2,10 @@
 Fetch incident/alert details (synthetic; production would use GCP Incident Management / Monitoring alerts).
 """
 
-import json
 from pathlib import Path
 
+from .._json import dumps, loads
+
 _DATA_DIR = Path(__file__).resolve().parent.parent.parent / "data" / "synthetic" / "cloud_reliability"
 
 
@@ -24,13 +25,13 @@ def get_incident(incident_id: str) -> str:
     """
     path = _DATA_DIR / "incidents.json"
     if not path.exists():
-        return json.dumps({"error": "Data not found", "incident_id": incident_id})
+        return dumps({"error": "Data not found", "incident_id": incident_id})
 
-    with open(path, "r") as f:
-        records = json.load(f)
+    with open(path, "rb") as f:
+        records = loads(f.read())
 
     for record in records:
         if record.get("incident_id") == incident_id:
-            return json.dumps(record, indent=2)
+            return dumps(record)
 
-    return json.dumps({"error": "Incident not found", "incident_id": incident_id})
+    return dumps({"error": "Incident not found", "incident_id": incident_id})
@@ -5,11 +5,50 @@ Production: set GCP_PROJECT_ID (and optionally GOOGLE_APPLICATION_CREDENTIALS or
 Install: pip install google-cloud-logging
 """
 
-import json
+import functools
+import itertools
 import os
+import threading
+from collections import defaultdict
 from pathlib import Path
 
+from .._json import dumps, load_file
+from . import _config
+
+try:
+    from google.cloud import logging as _cloud_logging
+except ImportError:  # google-cloud-logging not installed; synthetic data only
+    _cloud_logging = None
+
+# Cloud Logging clients by project; each holds credentials and a gRPC channel worth reusing
+_CLIENTS: dict[str, "_cloud_logging.Client"] = {}
+_CLIENTS_LOCK = threading.Lock()
+
 _DATA_DIR = Path(__file__).resolve().parent.parent.parent / "data" / "synthetic" / "cloud_reliability"
+_LOGS_PATH = str(_DATA_DIR / "logs.json")
+
+
+@functools.lru_cache(maxsize=1)
+def _index_logs(mtime_ns: int) -> tuple[list[dict], dict[str, list[int]], dict[str, list[int]]]:
+    """Load synthetic log entries with positions grouped by resource and by severity."""
+    entries = load_file(_LOGS_PATH).get("entries", [])
+    by_resource = defaultdict(list)
+    by_severity = defaultdict(list)
+    for i, e in enumerate(entries):
+        by_resource[e.get("resource")].append(i)
+        by_severity[e.get("severity")].append(i)
+    return entries, dict(by_resource), dict(by_severity)
+
+
+def _get_client(project_id: str):
+    """Return the shared Cloud Logging client for project_id, creating it on first use."""
+    client = _CLIENTS.get(project_id)
+    if client is None:
+        with _CLIENTS_LOCK:
+            client = _CLIENTS.get(project_id)
+            if client is None:
+                client = _CLIENTS[project_id] = _cloud_logging.Client(project=project_id)
+    return client
 
 
 def _fetch_from_cloud_logging(
@@ -17,14 +56,13 @@ def _fetch_from_cloud_logging(
     resource: str | None,
     severity: str | None,
     limit: int,
+    include_payload: bool = True,
 ) -> str:
     """Call Cloud Logging API via google.cloud.logging."""
-    try:
-        from google.cloud import logging as cloud_logging
-    except ImportError:
-        return json.dumps({"error": "google-cloud-logging not installed. pip install google-cloud-logging"})
+    if _cloud_logging is None:
+        return dumps({"error": "google-cloud-logging not installed. pip install google-cloud-logging"})
 
-    client = cloud_logging.Client(project=project_id)
+    client = _get_client(project_id)
     # Build filter: https://cloud.google.com/logging/docs/view/logging-query-language
     filters = []
     if severity:
@@ -33,33 +71,37 @@ def _fetch_from_cloud_logging(
         filters.append(f'resource.labels.resource_id="{resource}"')
     filter_str = " AND ".join(filters) if filters else None
 
-    entries_list = []
     try:
-        for entry in client.list_entries(
-            resource_names=[f"projects/{project_id}"],
-            filter_=filter_str,
-            order_by="timestamp desc",
-            page_size=limit,
-        ):
-            entries_list.append({
+        entries = itertools.islice(
+            client.list_entries(
+                resource_names=[f"projects/{project_id}"],
+                filter_=filter_str,
+                order_by="timestamp desc",
+                page_size=limit,
+            ),
+            max(limit, 0),
+        )
+        entries_list = [
+            {
                 "timestamp": entry.timestamp.isoformat() if entry.timestamp else None,
                 "severity": entry.severity,
                 "resource": getattr(entry.resource, "labels", {}) or {},
                 "text_payload": entry.text_payload,
-                "json_payload": dict(entry.json_payload) if entry.json_payload else None,
-            })
-            if len(entries_list) >= limit:
-                break
+                "json_payload": dict(entry.json_payload) if include_payload and entry.json_payload else None,
+            }
+            for entry in entries
+        ]
     except Exception as e:
-        return json.dumps({"error": str(e), "entries": []})
+        return dumps({"error": str(e), "entries": []})
 
-    return json.dumps({"entries": entries_list, "count": len(entries_list)}, indent=2)
+    return dumps({"entries": entries_list, "count": len(entries_list)})
 
 
 def get_log_entries(
     resource: str | None = None,
     severity: str | None = None,
     limit: int = 20,
+    include_payload: bool = True,
 ) -> str:
     """
     Fetch log entries for troubleshooting.
@@ -71,26 +113,36 @@ def get_log_entries(
         resource: Optional filter by resource (e.g. "backend-service-us-central1-a-001").
         severity: Optional filter by severity (e.g. "ERROR", "WARNING").
         limit: Max number of entries to return (default 20).
+        include_payload: Include each Cloud Logging entry's json_payload (default True);
+            pass False to skip converting large structured payloads.
 
     Returns:
         JSON string of log entries.
     """
-    project_id = os.environ.get("GCP_PROJECT_ID", "").strip()
+    project_id = _config.project_id()
     if project_id:
-        return _fetch_from_cloud_logging(project_id, resource, severity, limit)
-
-    path = _DATA_DIR / "logs.json"
-    if not path.exists():
-        return json.dumps({"error": "Logs data not found. Set GCP_PROJECT_ID for Cloud Logging.", "entries": []})
+        return _fetch_from_cloud_logging(project_id, resource, severity, limit, include_payload)
 
-    with open(path, "r") as f:
-        data = json.load(f)
-
-    entries = data.get("entries", [])
-    if resource:
-        entries = [e for e in entries if e.get("resource") == resource]
-    if severity:
-        entries = [e for e in entries if e.get("severity") == severity]
-    entries = entries[:limit]
-
-    return json.dumps({"entries": entries, "count": len(entries)}, indent=2)
+    try:
+        st = os.stat(_LOGS_PATH)
+    except FileNotFoundError:
+        return dumps({"error": "Logs data not found. Set GCP_PROJECT_ID for Cloud Logging.", "entries": []})
+
+    all_entries, by_resource, by_severity = _index_logs(st.st_mtime_ns)
+    if resource and severity:
+        # Walk the shorter position list and check the other field on each entry
+        resource_pos = by_resource.get(resource, [])
+        severity_pos = by_severity.get(severity, [])
+        if len(resource_pos) <= len(severity_pos):
+            positions = (i for i in resource_pos if all_entries[i].get("severity") == severity)
+        else:
+            positions = (i for i in severity_pos if all_entries[i].get("resource") == resource)
+    elif resource:
+        positions = by_resource.get(resource, [])
+    elif severity:
+        positions = by_severity.get(severity, [])
+    else:
+        positions = range(len(all_entries))
+    entries = [all_entries[i] for i in itertools.islice(positions, max(limit, 0))]
+
+    return dumps({"entries": entries, "count": len(entries)})
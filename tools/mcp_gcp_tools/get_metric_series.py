@@ -5,10 +5,11 @@ Production: set GCP_PROJECT_ID (and optionally GOOGLE_APPLICATION_CREDENTIALS or
 Install: pip install google-cloud-monitoring
 """
 
-import json
-import os
 from pathlib import Path
 
+from .._json import dumps, loads
+from . import _config
+
 _DATA_DIR = Path(__file__).resolve().parent.parent.parent / "data" / "synthetic" / "cloud_reliability"
 
 
@@ -21,7 +22,7 @@ def _fetch_from_cloud_monitoring(
     try:
         from google.cloud import monitoring_v3
     except ImportError:
-        return json.dumps({"error": "google-cloud-monitoring not installed. pip install google-cloud-monitoring"})
+        return dumps({"error": "google-cloud-monitoring not installed. pip install google-cloud-monitoring"})
 
     client = monitoring_v3.MetricServiceClient()
     project_name = f"projects/{project_id}"
@@ -73,9 +74,9 @@ def _fetch_from_cloud_monitoring(
                 "resource": dict(ts.resource.labels) if ts.resource and ts.resource.labels else {},
                 "points": points,
             })
-        return json.dumps({"time_series": time_series, "query_interval": "last 5 minutes"}, indent=2)
+        return dumps({"time_series": time_series, "query_interval": "last 5 minutes"})
     except Exception as e:
-        return json.dumps({"error": str(e), "time_series": []})
+        return dumps({"error": str(e), "time_series": []})
 
 
 def get_metric_series(
@@ -95,16 +96,16 @@ def get_metric_series(
     Returns:
         JSON string of time series data.
     """
-    project_id = os.environ.get("GCP_PROJECT_ID", "").strip()
+    project_id = _config.project_id()
     if project_id:
         return _fetch_from_cloud_monitoring(project_id, metric_name, resource)
 
     path = _DATA_DIR / "metrics.json"
     if not path.exists():
-        return json.dumps({"error": "Metrics data not found. Set GCP_PROJECT_ID for Cloud Monitoring."})
+        return dumps({"error": "Metrics data not found. Set GCP_PROJECT_ID for Cloud Monitoring."})
 
-    with open(path, "r") as f:
-        data = json.load(f)
+    with open(path, "rb") as f:
+        data = loads(f.read())
 
     series = data.get("time_series", [])
     if metric_name:
@@ -116,4 +117,4 @@ def get_metric_series(
         "time_series": series,
         "query_interval": data.get("query_interval"),
     }
-    return json.dumps(result, indent=2)
+    return dumps(result)
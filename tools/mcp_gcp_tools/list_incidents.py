@@ -4,10 +4,12 @@ List incidents (synthetic; production would use Incident Management / Monitoring
 Used by the Incident Coordinator to find open or recent incidents.
 """
 
-import json
 from pathlib import Path
 
+from .._json import dumps, load_file
+
 _DATA_DIR = Path(__file__).resolve().parent.parent.parent / "data" / "synthetic" / "cloud_reliability"
+_INCIDENTS_PATH = str(_DATA_DIR / "incidents.json")
 
 
 def list_incidents(status: str | None = None, limit: int = 20) -> str:
@@ -24,16 +26,14 @@ def list_incidents(status: str | None = None, limit: int = 20) -> str:
     Returns:
         JSON string with list of incidents and count.
     """
-    path = _DATA_DIR / "incidents.json"
-    if not path.exists():
-        return json.dumps({"error": "Incidents data not found", "incidents": [], "count": 0})
-
-    with open(path, "r") as f:
-        incidents = json.load(f)
+    try:
+        incidents = load_file(_INCIDENTS_PATH)
+    except FileNotFoundError:
+        return dumps({"error": "Incidents data not found", "incidents": [], "count": 0})
 
     if status:
         status_lower = status.lower()
         incidents = [i for i in incidents if (i.get("status") or "").lower() == status_lower]
     incidents = incidents[:limit]
 
-    return json.dumps({"incidents": incidents, "count": len(incidents)}, indent=2)
+    return dumps({"incidents": incidents, "count": len(incidents)})
@@ -2,9 +2,10 @@
 Suggest remediation for an incident using incident details, metrics, and logs (advisory only).
 """
 
-import json
 from pathlib import Path
 
+from .._json import dumps, loads
+
 _DATA_DIR = Path(__file__).resolve().parent.parent.parent / "data" / "synthetic" / "cloud_reliability"
 
 
@@ -24,10 +25,10 @@ def suggest_remediation(incident_id: str) -> str:
     """
     incidents_path = _DATA_DIR / "incidents.json"
     if not incidents_path.exists():
-        return json.dumps({"error": "Incident data not found", "incident_id": incident_id})
+        return dumps({"error": "Incident data not found", "incident_id": incident_id})
 
-    with open(incidents_path, "r") as f:
-        incidents = json.load(f)
+    with open(incidents_path, "rb") as f:
+        incidents = loads(f.read())
 
     incident = None
     for inc in incidents:
@@ -36,7 +37,7 @@ def suggest_remediation(incident_id: str) -> str:
             break
 
     if not incident:
-        return json.dumps({"error": "Incident not found", "incident_id": incident_id})
+        return dumps({"error": "Incident not found", "incident_id": incident_id})
 
     # Rule-based suggestions based on known synthetic incident INC-GCP-2025-001
     suggestions = []
@@ -70,4 +71,4 @@ def suggest_remediation(incident_id: str) -> str:
         "suggestions": suggestions,
         "note": "Advisory only. Apply changes per change management and rollback plan.",
     }
-    return json.dumps(result, indent=2)
+    return dumps(result)
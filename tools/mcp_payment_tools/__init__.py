@@ -5,8 +5,8 @@ Tools for accessing payment exception data and suggesting resolutions.
 Authority boundary: only these modules talk to payment/exception data.
 """
 
-from .get_payment_exception import get_payment_exception
+from .get_payment_exception import get_payment_exception, get_payment_exceptions
 from .suggest_payment_resolution import suggest_payment_resolution
 from .execute_payment_retry import execute_payment_retry
 
-__all__ = ["get_payment_exception", "suggest_payment_resolution", "execute_payment_retry"]
+__all__ = ["get_payment_exception", "get_payment_exceptions", "suggest_payment_resolution", "execute_payment_retry"]
@@ -5,8 +5,38 @@ Executes a payment retry after policy checks and human approval (if required).
 Authority boundary for payment actions.
 """
 
-import json
-from datetime import datetime
+import itertools
+import random
+from dataclasses import dataclass
+from time import gmtime, strftime
+
+from .._json import dumps
+
+_rand = random.random
+# Per-process sequence so retry ids stay unique within the same second
+_retry_seq = itertools.count(1)
+
+
+@dataclass(frozen=True, slots=True)
+class _RetrySucceeded:
+    status: str
+    retry_id: str
+    exception_id: str
+    message: str
+    timestamp: str
+    amount: float | None
+    reason: str
+
+
+@dataclass(frozen=True, slots=True)
+class _RetryFailed:
+    status: str
+    retry_id: str
+    exception_id: str
+    error: str
+    timestamp: str
+    amount: float | None
+    reason: str | None
 
 
 def execute_payment_retry(
@@ -33,30 +63,31 @@ def execute_payment_retry(
     # Simulate retry execution
     # In production, this would call: POST /api/payments/{exception_id}/retry
     
-    retry_id = f"RETRY-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+    now = gmtime()
+    retry_id = f"RETRY-{strftime('%Y%m%d-%H%M%S', now)}-{next(_retry_seq):04d}"
+    timestamp = strftime("%Y-%m-%dT%H:%M:%SZ", now)
     
     # Simulate success/failure (in production, this would be the actual API response)
     # For demo purposes, assume 90% success rate
-    import random
-    success = random.random() > 0.1
+    success = _rand() >= 0.1
     
     if success:
-        return json.dumps({
-            "status": "success",
-            "retry_id": retry_id,
-            "exception_id": exception_id,
-            "message": f"Payment retry initiated successfully. Retry ID: {retry_id}",
-            "timestamp": datetime.now().isoformat(),
-            "amount": amount,
-            "reason": reason or "Agent-initiated retry after investigation"
-        })
+        return dumps(_RetrySucceeded(
+            status="success",
+            retry_id=retry_id,
+            exception_id=exception_id,
+            message=f"Payment retry initiated successfully. Retry ID: {retry_id}",
+            timestamp=timestamp,
+            amount=amount,
+            reason=reason or "Agent-initiated retry after investigation",
+        ))
     else:
-        return json.dumps({
-            "status": "failed",
-            "retry_id": retry_id,
-            "exception_id": exception_id,
-            "error": "Payment retry failed - insufficient funds or account issue",
-            "timestamp": datetime.now().isoformat(),
-            "amount": amount,
-            "reason": reason
-        })
+        return dumps(_RetryFailed(
+            status="failed",
+            retry_id=retry_id,
+            exception_id=exception_id,
+            error="Payment retry failed - insufficient funds or account issue",
+            timestamp=timestamp,
+            amount=amount,
+            reason=reason,
+        ))
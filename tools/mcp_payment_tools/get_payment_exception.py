@@ -7,13 +7,23 @@ When PAYMENT_EXCEPTIONS_API_URL is set, calls the real API. Otherwise uses
 synthetic data from data/synthetic/payment_exceptions.json (for demos).
 """
 
-import json
+import functools
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .._json import dumps, load_index, loads
 
 _DATA_DIR = Path(__file__).resolve().parent.parent.parent / "data" / "synthetic"
+_EXCEPTIONS_PATH = str(_DATA_DIR / "payment_exceptions.json")
 
 # -----------------------------------------------------------------------------
 # API configuration (use in production)
@@ -25,62 +35,133 @@ _DATA_DIR = Path(__file__).resolve().parent.parent.parent / "data" / "synthetic"
 #   If PAYMENT_API_KEY is set, sends X-Api-Key: {value}
 #   If PAYMENT_API_HEADER is set, sends Authorization: {value}
 # PAYMENT_API_TIMEOUT - request timeout in seconds (default 10)
+# PAYMENT_CACHE_TTL - seconds to reuse a successful API response (default 30; 0 disables)
+#
+# These are read once per process; call _config.cache_clear() to pick up changes.
+# Malformed numeric values fall back to the defaults.
 # -----------------------------------------------------------------------------
 
 
-def _fetch_from_api(exception_id: str) -> str:
-    """
-    Fetch payment exception from the configured API.
-    Returns JSON string (same contract as synthetic) for success or error.
-    """
-    base_url = (os.environ.get("PAYMENT_EXCEPTIONS_API_URL") or "").rstrip("/")
-    if not base_url:
-        return json.dumps({"error": "PAYMENT_EXCEPTIONS_API_URL not configured", "exception_id": exception_id})
+@dataclass(frozen=True, slots=True)
+class _ApiConfig:
+    base_url: str
+    timeout: int
+    auth_headers: dict[str, str]
+    cache_ttl: float
+
 
-    timeout = int(os.environ.get("PAYMENT_API_TIMEOUT", "10"))
-    headers = {"Accept": "application/json", "Content-Type": "application/json"}
+def _env_number(name: str, default: int | float, type_: type = int) -> int | float:
+    """Parse a numeric env var, falling back to default when unset or malformed."""
+    try:
+        return type_(os.environ.get(name, default))
+    except ValueError:
+        return default
 
+
+@functools.lru_cache(maxsize=1)
+def _config() -> _ApiConfig:
+    """Snapshot the payment API environment variables."""
+    auth_headers = {}
     api_key = os.environ.get("PAYMENT_API_KEY")
     if api_key:
-        headers["X-Api-Key"] = api_key
+        auth_headers["X-Api-Key"] = api_key
     auth_header = os.environ.get("PAYMENT_API_HEADER")
     if auth_header:
-        headers["Authorization"] = auth_header
+        auth_headers["Authorization"] = auth_header
+    return _ApiConfig(
+        base_url=(os.environ.get("PAYMENT_EXCEPTIONS_API_URL") or "").rstrip("/"),
+        timeout=_env_number("PAYMENT_API_TIMEOUT", 10),
+        auth_headers=auth_headers,
+        cache_ttl=_env_number("PAYMENT_CACHE_TTL", 30.0, float),
+    )
+
+
+# Shared session: keeps connections alive across calls and retries gateway errors
+_SESSION = requests.Session()
+_SESSION.headers.update({"Accept": "application/json", "Content-Type": "application/json"})
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=(502, 503, 504), raise_on_status=False),
+)
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+
+# Successful API responses: (base_url, exception_id) -> (expires_at, json), least recently used first
+_CACHE_MAXSIZE = 512
+_CACHE: OrderedDict[tuple[str, str], tuple[float, str]] = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+
+def _cache_get(key: tuple[str, str]) -> str | None:
+    with _CACHE_LOCK:
+        hit = _CACHE.get(key)
+        if hit is None:
+            return None
+        if hit[0] <= time.monotonic():
+            del _CACHE[key]
+            return None
+        _CACHE.move_to_end(key)
+        return hit[1]
+
+
+def _cache_put(key: tuple[str, str], value: str, ttl: float) -> None:
+    with _CACHE_LOCK:
+        _CACHE[key] = (time.monotonic() + ttl, value)
+        _CACHE.move_to_end(key)
+        if len(_CACHE) > _CACHE_MAXSIZE:
+            _CACHE.popitem(last=False)
+
+
+def _fetch_from_api(exception_id: str) -> str:
+    """
+    Fetch payment exception from the configured API.
+    Returns JSON string (same contract as synthetic) for success or error.
+    """
+    config = _config()
+    if not config.base_url:
+        return dumps({"error": "PAYMENT_EXCEPTIONS_API_URL not configured", "exception_id": exception_id})
+
+    cache_key = (config.base_url, exception_id)
+    if config.cache_ttl > 0:
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
 
-    url = f"{base_url}/{exception_id}"
+    url = f"{config.base_url}/{exception_id}"
     try:
-        response = requests.get(url, headers=headers, timeout=timeout)
+        response = _SESSION.get(url, headers=config.auth_headers, timeout=config.timeout)
     except requests.exceptions.Timeout:
-        return json.dumps({
+        return dumps({
             "error": "API request timed out",
             "exception_id": exception_id,
         })
     except requests.exceptions.RequestException as e:
-        return json.dumps({
+        return dumps({
             "error": f"API request failed: {e!s}",
             "exception_id": exception_id,
         })
 
     if response.status_code == 404:
-        return json.dumps({
+        return dumps({
             "error": "Exception not found",
             "exception_id": exception_id,
         })
     if response.status_code >= 500:
-        return json.dumps({
+        return dumps({
             "error": f"API error: {response.status_code}",
             "exception_id": exception_id,
         })
     if response.status_code != 200:
-        return json.dumps({
+        return dumps({
             "error": f"API returned {response.status_code}",
             "exception_id": exception_id,
         })
 
     try:
-        data = response.json()
+        data = loads(response.content)
     except ValueError:
-        return json.dumps({
+        return dumps({
             "error": "Invalid JSON from API",
             "exception_id": exception_id,
         })
@@ -89,23 +170,24 @@ def _fetch_from_api(exception_id: str) -> str:
     if isinstance(data, dict) and "exception_id" not in data and "id" in data:
         data = dict(data)
         data["exception_id"] = data.get("id")
-    return json.dumps(data, indent=2)
+    result = dumps(data)
+    if config.cache_ttl > 0:
+        _cache_put(cache_key, result, config.cache_ttl)
+    return result
 
 
 def _fetch_from_synthetic(exception_id: str) -> str:
     """Fetch from local synthetic data (demos)."""
-    path = _DATA_DIR / "payment_exceptions.json"
-    if not path.exists():
-        return json.dumps({
+    try:
+        record = load_index(_EXCEPTIONS_PATH, "exception_id").get(exception_id)
+    except FileNotFoundError:
+        return dumps({
             "error": "Data not found",
             "exception_id": exception_id,
         })
-    with open(path, "r") as f:
-        records = json.load(f)
-    for record in records:
-        if record.get("exception_id") == exception_id:
-            return json.dumps(record, indent=2)
-    return json.dumps({
+    if record is not None:
+        return dumps(record)
+    return dumps({
         "error": "Exception not found",
         "exception_id": exception_id,
     })
@@ -126,6 +208,30 @@ def get_payment_exception(exception_id: str) -> str:
     Returns:
         JSON string of exception record, or {"error": "...", "exception_id": "..."} if not found/failed
     """
-    if os.environ.get("PAYMENT_EXCEPTIONS_API_URL"):
+    if _config().base_url:
         return _fetch_from_api(exception_id)
     return _fetch_from_synthetic(exception_id)
+
+
+def get_payment_exceptions(exception_ids: list[str]) -> dict[str, str]:
+    """
+    Fetch several payment exceptions at once.
+
+    With PAYMENT_EXCEPTIONS_API_URL set, the GETs run concurrently over the
+    shared connection pool, so N lookups cost roughly one round trip instead
+    of N. Each result has the same contract as get_payment_exception.
+
+    Args:
+        exception_ids: Exception identifiers (duplicates are fetched once)
+
+    Returns:
+        Dict mapping each exception_id to its JSON string
+    """
+    ids = list(dict.fromkeys(exception_ids))
+    if not ids:
+        return {}
+    if not _config().base_url:
+        return {exception_id: _fetch_from_synthetic(exception_id) for exception_id in ids}
+    # Stay within the session's pool_maxsize so connections are reused, not discarded
+    with ThreadPoolExecutor(max_workers=min(len(ids), 20)) as executor:
+        return dict(zip(ids, executor.map(_fetch_from_api, ids)))
@@ -4,7 +4,7 @@ MCP-style tool: suggest payment resolution (retry / waive_fee / escalate).
 Advisory only; human must approve. Authority boundary for payment actions.
 """
 
-import json
+from .._json import dumps
 
 
 def suggest_payment_resolution(
@@ -23,7 +23,7 @@ def suggest_payment_resolution(
     Returns:
         JSON string with confirmation message
     """
-    return json.dumps({
+    return dumps({
         "status": "suggestion_recorded",
         "exception_id": exception_id,
         "suggested_action": suggested_action,